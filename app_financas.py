@@ -1,20 +1,32 @@
 import os
+import io
+import csv
+import threading
+from collections import namedtuple, OrderedDict
+import numpy as np
 import pandas as pd
-import matplotlib # type: ignore
-matplotlib.use('Agg') # ESSENCIAL para rodar matplotlib em servidor
-import matplotlib.pyplot as plt
 from datetime import datetime
-import time
-from flask import Flask, render_template, request, redirect, url_for, session, flash
+from flask import Flask, render_template, stream_template, request, redirect, url_for, session, flash
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
 from flask_login import LoginManager, UserMixin, login_user, logout_user, login_required, current_user
-from werkzeug.security import generate_password_hash, check_password_hash
+from werkzeug.security import check_password_hash
+from argon2 import PasswordHasher
+from argon2.exceptions import VerifyMismatchError, InvalidHashError
 
 # --- Configuração de Caminhos Absolutos ---
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DATA_DIR = os.path.join(BASE_DIR, "data") # Pasta para os CSVs dos usuários
 STATIC_FOLDER = os.path.join(BASE_DIR, 'static')
 
+# Ordem fixa das colunas dos CSVs de cada conta
+COLUNAS = ["Data", "Tipo", "Categoria", "Descricao", "Valor", "Responsavel"]
+# Linha da tabela de registros: 'id' é a posição do registro no CSV
+Registro = namedtuple('Registro', ['id'] + COLUNAS)
+# Tipos conhecidos de cada coluna: o pandas não precisa inferir o esquema ao ler
+DTYPES_CSV = {"Data": str, "Tipo": "category", "Categoria": str, "Descricao": str, "Valor": str, "Responsavel": str}
+
 # Garante que as pastas de dados e estática existam
 os.makedirs(DATA_DIR, exist_ok=True)
 os.makedirs(STATIC_FOLDER, exist_ok=True)
@@ -26,10 +38,22 @@ app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///' + os.path.join(BASE_DIR, 'u
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 
 db = SQLAlchemy(app)
+
+@event.listens_for(Engine, "connect")
+def configurar_sqlite(dbapi_connection, connection_record):
+    """Ativa o modo WAL no SQLite para que as leituras não esperem pelas escritas."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
 login_manager = LoginManager(app)
 login_manager.login_view = 'login' # Redireciona para a rota 'login' se o usuário não estiver logado
 login_manager.login_message = "Por favor, faça login para acessar esta página."
 
+# Hash de senhas com Argon2id (parâmetros mínimos recomendados pela OWASP)
+password_hasher = PasswordHasher(time_cost=2, memory_cost=19456, parallelism=1)
+
 # --- Modelo de Usuário para o Banco de Dados ---
 class User(UserMixin, db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -38,14 +62,29 @@ class User(UserMixin, db.Model):
     account_name = db.Column(db.String(80), nullable=False) # Ex: 'conta_casal', 'conta_joao'
 
     def set_password(self, password):
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = password_hasher.hash(password)
 
     def check_password(self, password):
-        return check_password_hash(self.password_hash, password)
+        """Confere a senha; hashes antigos (Werkzeug) são convertidos para Argon2 no primeiro login."""
+        if self.password_hash.startswith('$argon2'):
+            try:
+                password_hasher.verify(self.password_hash, password)
+            except (VerifyMismatchError, InvalidHashError):
+                return False
+            precisa_atualizar = password_hasher.check_needs_rehash(self.password_hash)
+        elif check_password_hash(self.password_hash, password):
+            precisa_atualizar = True
+        else:
+            return False
+
+        if precisa_atualizar:
+            self.set_password(password)
+            db.session.commit()
+        return True
 
 @login_manager.user_loader
 def load_user(user_id):
-    return User.query.get(int(user_id))
+    return db.session.get(User, int(user_id))
 
 # --- Funções de Manipulação de Dados (CSV) ---
 def get_user_csv_path():
@@ -54,29 +93,181 @@ def get_user_csv_path():
         return os.path.join(DATA_DIR, f"{current_user.account_name}.csv")
     return None
 
+# Cache dos DataFrames já tipados por CSV: {csv_path: (st_mtime_ns, st_size, df, pendentes)}
+# 'pendentes' guarda os registros acrescentados ao arquivo que ainda não entraram no df
+# É um LRU: guarda no máximo CACHE_MAX_CONTAS contas, descartando a usada há mais tempo
+CACHE_MAX_CONTAS = 32
+_DF_CACHE = OrderedDict()
+# O servidor atende requisições em threads: todo acesso ao cache passa por este lock
+_DF_CACHE_LOCK = threading.Lock()
+
+def ler_do_cache(csv_path):
+    """Retorna a entrada da conta no cache (ou None), marcando-a como usada recentemente."""
+    with _DF_CACHE_LOCK:
+        entrada = _DF_CACHE.get(csv_path)
+        if entrada is not None:
+            _DF_CACHE.move_to_end(csv_path)
+        return entrada
+
+def guardar_no_cache(csv_path, entrada):
+    """Guarda a entrada no cache, descartando a conta usada há mais tempo se ele estiver cheio."""
+    with _DF_CACHE_LOCK:
+        _DF_CACHE[csv_path] = entrada
+        _DF_CACHE.move_to_end(csv_path)
+        while len(_DF_CACHE) > CACHE_MAX_CONTAS:
+            _DF_CACHE.popitem(last=False)
+
+def descartar_do_cache(csv_path):
+    """Remove e retorna a entrada da conta no cache (ou None)."""
+    with _DF_CACHE_LOCK:
+        return _DF_CACHE.pop(csv_path, None)
+
+def preparar_dados(df):
+    """Converte os tipos e calcula as colunas derivadas usadas pelas rotas."""
+    df["Valor"] = pd.to_numeric(df["Valor"], errors='coerce').fillna(0) # valores inválidos viram 0
+    # Poucas datas distintas se repetem em muitas linhas: converte só as únicas
+    datas_unicas = df['Data'].unique()
+    datas_convertidas = pd.Series(pd.to_datetime(datas_unicas, format='%Y-%m-%d', errors='coerce'), index=datas_unicas)
+    legado = datas_convertidas.isna()
+    if legado.any(): # datas no formato antigo (dd-mm-aaaa) ainda não migradas
+        datas_convertidas[legado] = pd.to_datetime(datas_convertidas.index[legado], format='%d-%m-%Y', errors='coerce')
+    df['Data_dt'] = df['Data'].map(datas_convertidas)
+    # Limpa os textos uma única vez; as rotas usam as colunas já normalizadas
+    df['Categoria'] = df['Categoria'].fillna('').astype(str).str.strip()
+    df['Responsavel'] = df['Responsavel'].fillna('').astype(str).str.strip()
+    df['Categoria_Normalizada'] = df['Categoria'].str.lower()
+    return df
+
 def carregar_dados():
-    """Carrega os dados do arquivo CSV específico da conta do usuário."""
+    """Carrega os dados do arquivo CSV específico da conta do usuário.
+
+    O DataFrame é reaproveitado entre requisições enquanto o arquivo não mudar,
+    por isso deve ser tratado como somente leitura.
+    """
     csv_path = get_user_csv_path()
-    if csv_path and os.path.exists(csv_path):
-        try:
-            df = pd.read_csv(csv_path, encoding="utf-8")
-        except UnicodeDecodeError:
-            df = pd.read_csv(csv_path, encoding="latin1")
-    else:
-        df = pd.DataFrame(columns=["Data", "Tipo", "Categoria", "Descricao", "Valor", "Responsavel"])
-    
-    if "Valor" in df.columns:
-        df["Valor"] = pd.to_numeric(df["Valor"], errors='coerce').fillna(0)
-    
+    st = os.stat(csv_path) if csv_path and os.path.exists(csv_path) else None
+    if st is None or st.st_size == 0:
+        return preparar_dados(pd.DataFrame(columns=COLUNAS))
+
+    cache = ler_do_cache(csv_path)
+    if cache and cache[:2] == (st.st_mtime_ns, st.st_size):
+        df, pendentes = cache[2], cache[3]
+        if pendentes:
+            # Incorpora de uma só vez todos os registros acrescentados desde a última leitura
+            novos = preparar_dados(pd.DataFrame(pendentes, columns=COLUNAS))
+            df = pd.concat([df, novos], ignore_index=True)
+            guardar_no_cache(csv_path, (st.st_mtime_ns, st.st_size, df, []))
+        return df
+
+    try:
+        df = pd.read_csv(csv_path, encoding="utf-8", dtype=DTYPES_CSV)
+    except UnicodeDecodeError:
+        df = pd.read_csv(csv_path, encoding="latin1", dtype=DTYPES_CSV)
+    df = preparar_dados(df)
+    guardar_no_cache(csv_path, (st.st_mtime_ns, st.st_size, df, []))
     return df
 
 def salvar_dados(df):
     """Salva o DataFrame modificado de volta no arquivo CSV da conta do usuário."""
     csv_path = get_user_csv_path()
     if csv_path:
-        cols_to_drop = ['index', 'Data_dt', 'Categoria_Normalizada_Filtro', 'Categoria_Normalizada', 'Mes']
+        cols_to_drop = ['Data_dt', 'Categoria_Normalizada']
         df_to_save = df.drop(columns=[col for col in cols_to_drop if col in df.columns], errors='ignore')
         df_to_save.to_csv(csv_path, index=False, encoding="utf-8")
+        descartar_do_cache(csv_path)
+
+# CSVs já confirmados como UTF-8 neste processo (arquivos antigos podem estar em latin1)
+_CSV_UTF8 = set()
+
+def garantir_utf8(csv_path):
+    """Converte para UTF-8, uma única vez, um CSV antigo salvo em latin1."""
+    if csv_path in _CSV_UTF8:
+        return
+    with open(csv_path, 'rb') as f:
+        conteudo = f.read()
+    try:
+        conteudo.decode('utf-8')
+    except UnicodeDecodeError:
+        tmp_path = csv_path + '.tmp'
+        with open(tmp_path, 'w', encoding="utf-8", newline='') as f:
+            f.write(conteudo.decode('latin1'))
+        os.replace(tmp_path, csv_path)
+        descartar_do_cache(csv_path)
+    _CSV_UTF8.add(csv_path)
+
+def append_registro(registro):
+    """Acrescenta um único registro ao final do CSV da conta, sem reescrever o arquivo."""
+    csv_path = get_user_csv_path()
+    if csv_path:
+        if os.path.exists(csv_path):
+            garantir_utf8(csv_path) # não mistura UTF-8 com um arquivo latin1
+        cache = descartar_do_cache(csv_path)
+        with open(csv_path, 'a+b') as f:
+            antes = os.fstat(f.fileno())
+            buffer = io.StringIO()
+            writer = csv.DictWriter(buffer, fieldnames=COLUNAS, lineterminator='\n') # igual ao to_csv
+            if antes.st_size == 0:
+                writer.writeheader()
+            writer.writerow(registro)
+            linha = buffer.getvalue().encode("utf-8")
+            if antes.st_size > 0:
+                # Arquivos salvos por editores/Excel podem não terminar com quebra de linha
+                f.seek(antes.st_size - 1)
+                if f.read(1) not in (b'\n', b'\r'):
+                    linha = b'\n' + linha
+            f.write(linha)
+            f.flush()
+            depois = os.fstat(f.fileno())
+        # O cache só continua válido se nenhum outro processo escreveu no arquivo
+        # antes ou durante este acréscimo; nesse caso o registro fica pendente
+        if (cache and antes.st_size > 0 and cache[:2] == (antes.st_mtime_ns, antes.st_size)
+                and depois.st_size == antes.st_size + len(linha)):
+            guardar_no_cache(csv_path, (depois.st_mtime_ns, depois.st_size, cache[2], cache[3] + [registro]))
+
+def migrar_datas_iso():
+    """Reescreve as datas dd-mm-aaaa de todos os CSVs no formato ISO (aaaa-mm-dd).
+
+    Basta rodar uma vez; carregar_dados() continua aceitando o formato antigo.
+    """
+    for nome in os.listdir(DATA_DIR):
+        if not nome.endswith('.csv'):
+            continue
+        csv_path = os.path.join(DATA_DIR, nome)
+        try:
+            try:
+                df = pd.read_csv(csv_path, encoding="utf-8", dtype=str, keep_default_na=False)
+            except UnicodeDecodeError:
+                df = pd.read_csv(csv_path, encoding="latin1", dtype=str, keep_default_na=False)
+        except (pd.errors.EmptyDataError, pd.errors.ParserError) as erro:
+            print(f"Migração de datas: '{nome}' ignorado ({erro})")
+            continue
+        if 'Data' not in df.columns:
+            print(f"Migração de datas: '{nome}' ignorado (sem coluna 'Data')")
+            continue
+        legado = pd.to_datetime(df['Data'], format='%d-%m-%Y', errors='coerce')
+        if legado.notna().any():
+            df['Data'] = legado.dt.strftime('%Y-%m-%d').where(legado.notna(), df['Data'])
+            df.to_csv(csv_path, index=False, encoding="utf-8")
+            descartar_do_cache(csv_path)
+
+def iter_registros(df):
+    """Gera as linhas da tabela de registros, da mais recente para a mais antiga.
+
+    O CSV guarda a data em ISO; na tela ela aparece como dd-mm-aaaa.
+    """
+    # Percorre visões invertidas de cada coluna, sem montar um DataFrame intermediário
+    colunas = [df.index[::-1]] + [df[col].array[::-1] for col in ['Data_dt'] + COLUNAS[1:]]
+    for id_registro, data, *resto in zip(*colunas):
+        yield Registro(id_registro, data.strftime('%d-%m-%Y'), *resto)
+
+def formatar_ano_mes(ano_mes):
+    """Converte um mês no formato inteiro AAAAMM para a string 'AAAA-MM'."""
+    return f"{ano_mes // 100:04d}-{ano_mes % 100:02d}"
+
+def parse_ano_mes(texto):
+    """Converte uma string 'AAAA-MM' para o inteiro AAAAMM (-1 se inválida)."""
+    digitos = texto.replace('-', '')
+    return int(digitos) if digitos.isdigit() else -1
 
 # --- Rotas de Autenticação (Login, Logout, Registro) ---
 @app.route('/login', methods=['GET', 'POST'])
@@ -137,103 +328,101 @@ def register():
 @login_required
 def index():
     if request.method == 'POST':
-        df = carregar_dados()
         novo_registro = {
-            "Data": datetime.now().strftime("%d-%m-%Y"),
+            "Data": datetime.now().strftime("%Y-%m-%d"),
             "Tipo": request.form['Tipo'],
             "Categoria": request.form['Categoria'].strip(),
             "Descricao": request.form['Descricao'].strip(),
             "Valor": float(request.form['Valor'].strip().replace(",", ".")),
             "Responsavel": request.form['Responsavel'].strip()
         }
-        df = pd.concat([df, pd.DataFrame([novo_registro], columns=df.columns)], ignore_index=True)
-        salvar_dados(df)
+        append_registro(novo_registro)
         return redirect(url_for('index'))
 
     df = carregar_dados()
-    df.reset_index(inplace=True)
     
     filtro_mes_selecionado = request.args.get('filtro_mes', '')
     filtro_responsavel_selecionado = request.args.get('filtro_responsavel', '')
     filtro_categoria_selecionado = request.args.get('filtro_categoria', '')
 
     meses_disponiveis, responsaveis_disponiveis, categorias_disponiveis = [], [], []
+    df_filtrado = df
     if not df.empty:
-        df['Data_dt'] = pd.to_datetime(df['Data'], format='%d-%m-%Y', errors='coerce')
-        df.dropna(subset=['Data_dt'], inplace=True)
-        meses_disponiveis = sorted(df['Data_dt'].dt.strftime('%Y-%m').unique().tolist(), reverse=True)
-        responsaveis_disponiveis = sorted(df['Responsavel'].str.strip().unique().tolist())
-        categorias_disponiveis = sorted(df['Categoria'].str.strip().unique().tolist())
+        # Linhas com data inválida ficam fora da máscara, sem copiar o DataFrame do cache
+        validas = df['Data_dt'].notna().to_numpy()
+        # Mês como inteiro AAAAMM (-1 nas datas inválidas): evita formatar cada data com strftime
+        ano_mes = np.full(len(df), -1, dtype=np.int64)
+        anos, meses = df['Data_dt'].dt.year.to_numpy(), df['Data_dt'].dt.month.to_numpy()
+        ano_mes[validas] = anos[validas] * 100 + meses[validas]
+        meses_disponiveis = [formatar_ano_mes(v) for v in np.unique(ano_mes[validas])[::-1]]
+        responsaveis_disponiveis = sorted(pd.unique(df['Responsavel'].to_numpy()[validas]).tolist())
+        categorias_disponiveis = sorted(pd.unique(df['Categoria'].to_numpy()[validas]).tolist())
 
-    df_filtrado = df.copy()
-    if not df_filtrado.empty:
-        df_filtrado['Categoria_Normalizada_Filtro'] = df_filtrado['Categoria'].str.strip()
+        # Combina todos os filtros em uma única máscara e recorta o DataFrame uma só vez
+        mask = validas.copy()
         if filtro_mes_selecionado:
-            df_filtrado = df_filtrado[df_filtrado['Data_dt'].dt.strftime('%Y-%m') == filtro_mes_selecionado]
+            mask &= ano_mes == parse_ano_mes(filtro_mes_selecionado)
         if filtro_responsavel_selecionado:
-            df_filtrado = df_filtrado[df_filtrado['Responsavel'].str.strip() == filtro_responsavel_selecionado]
+            mask &= df['Responsavel'].values == filtro_responsavel_selecionado
         if filtro_categoria_selecionado:
-            df_filtrado = df_filtrado[df_filtrado['Categoria_Normalizada_Filtro'] == filtro_categoria_selecionado]
-
-    total_entradas = df_filtrado[df_filtrado['Tipo'] == 'entrada']['Valor'].sum() if not df_filtrado.empty else 0
-    total_saidas = df_filtrado[df_filtrado['Tipo'] == 'saida']['Valor'].sum() if not df_filtrado.empty else 0
-    saldo_total = total_entradas - total_saidas
+            mask &= df['Categoria'].values == filtro_categoria_selecionado
+        df_filtrado = df.loc[mask]
+        ano_mes_filtrado = ano_mes[mask]
 
-    graph1_url, graph2_url = None, None
-    all_entries = []
+    total_entradas, total_saidas = 0, 0
+    graph1_data, graph2_data = None, None
+    all_entries = iter(())
 
     if not df_filtrado.empty:
-        df_filtrado['Categoria_Normalizada'] = df_filtrado['Categoria'].str.strip().str.lower()
-        gastos_por_categoria = df_filtrado[df_filtrado['Tipo'] == 'saida'].groupby('Categoria_Normalizada')['Valor'].sum()
-        if not gastos_por_categoria.empty:
-            plt.figure(figsize=(10, 6))
-            gastos_por_categoria.plot(kind='bar', color='#d9534f')
-            plt.title('Gastos por Categoria')
-            plt.xlabel('Categoria')
-            plt.ylabel('Valor (R$)')
-            plt.xticks(rotation=45, ha="right")
-            plt.tight_layout()
-            graph1_filename = f"gastos_categoria_{current_user.id}_{int(time.time())}.png"
-            plt.savefig(os.path.join(STATIC_FOLDER, graph1_filename))
-            plt.close()
-            graph1_url = url_for('static', filename=graph1_filename)
-
-        df_filtrado['Mes'] = df_filtrado['Data_dt'].dt.to_period('M').astype(str)
-        entradas_saidas_por_mes = df_filtrado.groupby(['Mes', 'Tipo'])['Valor'].sum().unstack().fillna(0)
-        if not entradas_saidas_por_mes.empty:
-            plt.figure(figsize=(12, 6))
-            entradas_saidas_por_mes.plot(kind='bar', figsize=(12, 6), color=['#5cb85c', '#d9534f'])
-            plt.title('Entradas vs. Saídas por Mês')
-            plt.xlabel('Mês')
-            plt.ylabel('Valor (R$)')
-            plt.xticks(rotation=45, ha="right")
-            plt.legend(['Entrada', 'Saída'])
-            plt.tight_layout()
-            graph2_filename = f"entradas_saidas_{current_user.id}_{int(time.time())}.png"
-            plt.savefig(os.path.join(STATIC_FOLDER, graph2_filename))
-            plt.close()
-            graph2_url = url_for('static', filename=graph2_filename)
+        # Agrega com np.bincount sobre códigos inteiros (tipo, mês e categoria):
+        # uma passada em C por agregação, sem groupby sobre colunas de texto
+        valores = df_filtrado['Valor'].to_numpy()
+        tipo_codigos = pd.Categorical(df_filtrado['Tipo'], categories=['entrada', 'saida']).codes.astype(np.intp)
+        mes_codigos, meses_grafico = pd.factorize(ano_mes_filtrado, sort=True)
+        n_meses = len(meses_grafico)
+
+        validos = tipo_codigos >= 0
+        por_tipo_mes = np.bincount(tipo_codigos[validos] * n_meses + mes_codigos[validos],
+                                   weights=valores[validos], minlength=2 * n_meses).reshape(2, n_meses)
+        total_entradas, total_saidas = por_tipo_mes.sum(axis=1)
+
+        # Os gráficos são desenhados no navegador (Chart.js) a partir destes dados
+        saidas = tipo_codigos == 1
+        if saidas.any():
+            categoria_codigos, categorias = pd.factorize(df_filtrado['Categoria_Normalizada'].to_numpy()[saidas], sort=True)
+            gastos_por_categoria = np.bincount(categoria_codigos, weights=valores[saidas], minlength=len(categorias))
+            graph1_data = {
+                'labels': categorias.tolist(),
+                'valores': gastos_por_categoria.tolist()
+            }
+
+        if validos.any():
+            graph2_data = {
+                'labels': [formatar_ano_mes(v) for v in meses_grafico],
+                'entradas': por_tipo_mes[0].tolist(),
+                'saidas': por_tipo_mes[1].tolist()
+            }
         
-        all_entries = df_filtrado.to_dict('records')
+        all_entries = iter_registros(df_filtrado)
+
+    saldo_total = total_entradas - total_saidas
 
-    return render_template('index.html', 
-                           graph1_url=graph1_url, graph2_url=graph2_url,
-                           entries=all_entries,
-                           total_entradas=total_entradas, total_saidas=total_saidas, saldo_total=saldo_total,
-                           meses_disponiveis=meses_disponiveis, responsaveis_disponiveis=responsaveis_disponiveis,
-                           filtro_mes_selecionado=filtro_mes_selecionado, filtro_responsavel_selecionado=filtro_responsavel_selecionado,
-                           categorias_disponiveis=categorias_disponiveis, filtro_categoria_selecionado=filtro_categoria_selecionado)
+    # Envia a página aos poucos: o topo chega antes de a tabela ser gerada
+    return app.response_class(stream_template('index.html', 
+                                              graph1_data=graph1_data, graph2_data=graph2_data,
+                                              entries=all_entries,
+                                              total_entradas=total_entradas, total_saidas=total_saidas, saldo_total=saldo_total,
+                                              meses_disponiveis=meses_disponiveis, responsaveis_disponiveis=responsaveis_disponiveis,
+                                              filtro_mes_selecionado=filtro_mes_selecionado, filtro_responsavel_selecionado=filtro_responsavel_selecionado,
+                                              categorias_disponiveis=categorias_disponiveis, filtro_categoria_selecionado=filtro_categoria_selecionado))
 
 @app.route('/delete/<int:record_index>', methods=['POST'])
 @login_required
 def delete_record(record_index):
     """Deleta um registro pelo seu índice."""
-    df = carregar_dados()
-    if not df.empty:
-        df.reset_index(inplace=True)
-        if record_index in df['index'].values:
-            df = df[df['index'] != record_index]
-            salvar_dados(df)
+    df = carregar_dados() # o índice do DataFrame é a posição da linha no CSV
+    if record_index in df.index:
+        salvar_dados(df.drop(index=record_index))
     return redirect(url_for('index'))
 
 # --- Função para criar o banco de dados ---
@@ -244,9 +433,5 @@ def create_database(app):
 
 if __name__ == '__main__':
     create_database(app) # Cria o banco de dados se não existir
-    # Limpa gráficos antigos ao iniciar localmente
-    if os.path.exists(STATIC_FOLDER):
-        for item in os.listdir(STATIC_FOLDER):
-            if item.endswith(".png"):
-                os.remove(os.path.join(STATIC_FOLDER, item))
+    migrar_datas_iso() # Converte datas antigas dos CSVs para o formato ISO
     app.run(debug=True)